@@ -17,18 +17,158 @@ Usage:
 import os
 import sys
 import json
+import logging
+import random
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 from datetime import datetime
+from urllib.parse import urljoin
 import pytz
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 import argparse
 from dotenv import load_dotenv; load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limiting and transient gateway/server errors
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# Methods safe to resend after the server may have acted on them (matches
+# urllib3's Retry default). Other methods are only retried when the request
+# provably never reached the server: a 429 or a failure to connect.
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE'})
+
+# (connect, read) timeout in seconds for LaunchDarkly API calls
+REQUEST_TIMEOUT = (3, 10)
+
+# Upper bound on worker threads for batch operations. Batches run one at a
+# time, so this also bounds in-flight API requests per scheduler.
+MAX_WORKERS = 8
+
+# Per-thread line buffer used by _print/_buffered
+_output = threading.local()
+
+
+def _print(message: str = "") -> None:
+    """Print a line, or collect it if the current thread is buffering its output."""
+    lines = getattr(_output, 'lines', None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+def _buffered(func, *args) -> Tuple[Any, List[str]]:
+    """
+    Call func, collecting the lines it prints through _print.
+    
+    Lets worker threads hand their output back so each flag's lines can be
+    printed as one block instead of interleaving with other workers.
+    
+    Returns:
+        Tuple of func's return value and the collected lines
+    """
+    _output.lines = []
+    try:
+        return func(*args), _output.lines
+    finally:
+        _output.lines = None
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body straight from bytes, skipping the text decode."""
+    return json.loads(response.content)
+
+
+def _body_preview(response: requests.Response, limit: int = 500) -> str:
+    """
+    Return the start of a response body for error output.
+    
+    Only the first `limit` bytes are decoded. The full body is logged at DEBUG level.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full response body: %s", response.text)
+    content = response.content
+    preview = content[:limit].decode('utf-8', 'replace')
+    return preview + '…' if len(content) > limit else preview
+
+
+class RateLimiter:
+    """Thread-safe token bucket that adapts its rate to LaunchDarkly's rate-limit headers."""
+    
+    def __init__(self, rate: float = 10.0, capacity: float = 10.0):
+        """
+        Args:
+            rate: Initial refill rate in requests per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._condition = threading.Condition()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        with self._condition:
+            self._refill()
+            while self.tokens < 1:
+                self._condition.wait((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def update(self, headers):
+        """
+        Recompute the refill rate from a response's rate-limit headers.
+        
+        LaunchDarkly reports the requests left in the current window via
+        X-Ratelimit-Route-Remaining (or X-Ratelimit-Global-Remaining) and the
+        window end as a Unix timestamp in milliseconds via X-Ratelimit-Reset.
+        Stored tokens are clamped to the requests left, so an exhausted window
+        is not hit with a burst.
+        """
+        remaining = (headers.get('X-Ratelimit-Route-Remaining')
+                     or headers.get('X-Ratelimit-Global-Remaining'))
+        reset = headers.get('X-Ratelimit-Reset')
+        if remaining is None or reset is None:
+            return
+        
+        try:
+            remaining = int(remaining)
+            reset_seconds = int(reset) / 1000 - time.time()
+        except ValueError:
+            return
+        
+        with self._condition:
+            self._refill()
+            self.tokens = min(self.tokens, remaining)
+            self.rate = max(1, remaining) / max(1.0, reset_seconds)
+            self._condition.notify_all()
+
+
 class LaunchDarklyScheduler:
     """LaunchDarkly API scheduler for feature flag targeting rules."""
     
-    def __init__(self):
-        """Initialize the scheduler with environment variables."""
+    # Resolved once; pytz timezone lookups are not free
+    _EST = pytz.timezone('US/Eastern')
+    _UTC = pytz.utc
+    
+    def __init__(self, verify: bool = False):
+        """
+        Initialize the scheduler with environment variables.
+        
+        Args:
+            verify: Check the API connection up front (costs one extra request)
+        """
         self.api_key = os.getenv('LD_API_KEY')
         self.project_key = os.getenv('LD_PROJECT_KEY')
         self.environment_key = os.getenv('LD_ENVIRONMENT_KEY')
@@ -47,17 +187,26 @@ class LaunchDarklyScheduler:
             'Content-Type': 'application/json'
         }
         
-        # Test API connection on initialization
-        self._test_api_connection()
+        # Reuse one pooled session so every call skips the TCP/TLS handshake.
+        # Every request goes to a single host, and the pool keeps one
+        # keep-alive connection per batch worker.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+        self.session.mount('https://', adapter)
+        self._rate_limiter = RateLimiter()
+        
+        if verify:
+            self.verify_connection()
     
-    def _test_api_connection(self) -> bool:
+    def verify_connection(self) -> bool:
         """Test the API connection and authentication."""
         try:
             # Test with a simple API call to get project info
             url = f'{self.base_url}/projects/{self.project_key}'
-            print(f"🔐 Testing API connection to: {url}")
+            logger.debug("🔐 Testing API connection to: %s", url)
             
-            response = requests.get(url, headers=self.headers)
+            response = self._request('GET', url)
             
             if response.status_code == 401:
                 print("❌ Authentication failed!")
@@ -73,13 +222,90 @@ class LaunchDarklyScheduler:
                 return True
             else:
                 print(f"❌ Unexpected response: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"   Response: {_body_preview(response)}")
                 return False
                 
         except requests.exceptions.RequestException as e:
             print(f"❌ Network error testing API connection: {e}")
             return False
     
+    def _backoff_delay(self, attempt: int, base: float = 1.0, jitter: float = 0.5,
+                       max_delay: float = 30.0) -> float:
+        """Exponential backoff delay in seconds with random jitter."""
+        return min(max_delay, base * 2 ** attempt * (1 + random.uniform(0, jitter)))
+    
+    @staticmethod
+    def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+        """Whether a request failed before a connection was established."""
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        reason = getattr(error.args[0], 'reason', None) if error.args else None
+        return isinstance(reason, NewConnectionError)
+    
+    def _request(self, method: str, url: str, max_retries: int = 3, **kwargs) -> requests.Response:
+        """
+        Send a request through the session, retrying transient failures.
+        
+        Requests are paced by a token bucket tuned from LaunchDarkly's
+        rate-limit headers.
+        
+        Failures are retried with exponential backoff (honoring Retry-After on
+        429). Idempotent methods retry on 429/502/503/504, connection errors and
+        timeouts. Other methods, such as POST, retry only on 429 and on failures
+        to connect, since anything later may mean the server already acted on
+        the request. Any other response, including 4xx validation and auth
+        errors, is returned as-is. Requests default to REQUEST_TIMEOUT.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            max_retries: Number of retries after the first attempt
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response
+        """
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        
+        for attempt in range(max_retries + 1):
+            self._rate_limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt == max_retries or not (idempotent or self._is_connect_error(e)):
+                    raise
+                delay = self._backoff_delay(attempt)
+                logger.warning("⏳ %s on %s %s, retrying in %.1fs", e.__class__.__name__, method, url, delay)
+                time.sleep(delay)
+                continue
+            
+            self._rate_limiter.update(response.headers)
+            retryable = response.status_code == 429 or (
+                idempotent and response.status_code in RETRYABLE_STATUS_CODES
+            )
+            if not retryable or attempt == max_retries:
+                return response
+            
+            delay = self._backoff_delay(attempt)
+            retry_after = response.headers.get('Retry-After', '')
+            if response.status_code == 429 and retry_after.isdigit():
+                delay = min(30.0, float(retry_after))
+            logger.warning("⏳ Got %s on %s %s, retrying in %.1fs", response.status_code, method, url, delay)
+            time.sleep(delay)
+        
+        return response
+    
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def est_to_utc(self, est_time_str: str) -> int:
         """
         Convert EST time string to UTC timestamp in milliseconds.
@@ -91,15 +317,12 @@ class LaunchDarklyScheduler:
             UTC timestamp in milliseconds
         """
         try:
-            est = pytz.timezone('US/Eastern')
-            utc = pytz.utc
-            
             # Parse the EST time
             est_time = datetime.strptime(est_time_str, '%Y-%m-%d %H:%M:%S')
-            est_time = est.localize(est_time)
+            est_time = self._EST.localize(est_time)
             
             # Convert to UTC
-            utc_time = est_time.astimezone(utc)
+            utc_time = est_time.astimezone(self._UTC)
             
             # Return timestamp in milliseconds
             return int(utc_time.timestamp() * 1000)
@@ -107,6 +330,32 @@ class LaunchDarklyScheduler:
         except ValueError as e:
             raise ValueError(f"Invalid time format. Use 'YYYY-MM-DD HH:MM:SS': {e}")
     
+    def _validate_schedule_time(self, schedule_time_est: str) -> Optional[int]:
+        """
+        Parse an EST schedule time and check that it is in the future.
+        
+        Args:
+            schedule_time_est: Schedule time in EST format 'YYYY-MM-DD HH:MM:SS'
+            
+        Returns:
+            UTC timestamp in milliseconds, or None if invalid
+        """
+        try:
+            schedule_time_utc = self.est_to_utc(schedule_time_est)
+        except ValueError as e:
+            print(f"Error parsing schedule time: {e}")
+            return None
+        
+        schedule_datetime = datetime.fromtimestamp(schedule_time_utc/1000, tz=self._UTC)
+        now_utc = datetime.now(self._UTC)
+        if schedule_datetime <= now_utc:
+            print(f"❌ Schedule time must be in the future!")
+            print(f"   Current time (UTC): {now_utc}")
+            print(f"   Schedule time (UTC): {schedule_datetime}")
+            return None
+        
+        return schedule_time_utc
+    
     def get_flag_config(self, flag_key: str) -> Optional[Dict[str, Any]]:
         """
         Get current flag configuration.
@@ -117,53 +366,100 @@ class LaunchDarklyScheduler:
         Returns:
             Flag configuration dict or None if error
         """
-        # Use the correct LaunchDarkly API v2 endpoint format
-        url = f'{self.base_url}/flags/{self.project_key}/{flag_key}'
+        # Use the correct LaunchDarkly API v2 endpoint format. Only variations
+        # are needed, so drop the other environments' rules and targets.
+        url = f'{self.base_url}/flags/{self.project_key}/{flag_key}?env={self.environment_key}'
         
         try:
-            print(f"🔍 Fetching flag config from: {url}")
-            print(f"🔍 Headers being sent: {self.headers}")
-            response = requests.get(url, headers=self.headers)
+            logger.debug("🔍 Fetching flag config from: %s", url)
+            response = self._request('GET', url)
             
             if response.status_code == 401:
-                print(f"❌ Authentication failed. Please check your API key and permissions.")
-                print(f"   Response: {response.text}")
+                _print(f"❌ Authentication failed. Please check your API key and permissions.")
+                _print(f"   Response: {_body_preview(response)}")
                 return None
             elif response.status_code == 404:
-                print(f"❌ Flag '{flag_key}' not found in project '{self.project_key}'")
+                _print(f"❌ Flag '{flag_key}' not found in project '{self.project_key}'")
                 return None
             
             response.raise_for_status()
-            return response.json()
+            return _json(response)
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching flag {flag_key}: {e}")
+            _print(f"❌ Error fetching flag {flag_key}: {e}")
             if hasattr(e, 'response') and e.response is not None:
-                print(f"   Status Code: {e.response.status_code}")
-                print(f"   Response: {e.response.text}")
+                _print(f"   Status Code: {e.response.status_code}")
+                _print(f"   Response: {_body_preview(e.response)}")
             return None
     
-    def create_targeting_rule(self, segment_key: str, variation: int = 0) -> Dict[str, Any]:
+    def _get_flag_configs(self, flag_keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
         """
-        Create a targeting rule for a segment.
+        Fetch configurations for several flags concurrently.
         
         Args:
-            segment_key: The segment key to target
-            variation: The variation index to serve (default: 0)
+            flag_keys: List of feature flag keys
             
         Returns:
-            Targeting rule dict
+            Dict mapping flag keys to their configuration (None if the fetch failed)
+        """
+        unique_keys = list(dict.fromkeys(flag_keys))
+        flag_configs = {}
+        max_workers = max(1, min(MAX_WORKERS, len(unique_keys)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = executor.map(lambda key: _buffered(self.get_flag_config, key), unique_keys)
+            for flag_key, (flag_config, lines) in zip(unique_keys, outcomes):
+                for line in lines:
+                    print(line)
+                flag_configs[flag_key] = flag_config
+        return flag_configs
+    
+    def _resolve_variation_id(self, flag_config: Dict[str, Any], variation: int) -> Optional[str]:
+        """
+        Look up a variation's ID from its 1-based UI number.
+        
+        Args:
+            flag_config: Flag configuration as returned by get_flag_config
+            variation: The variation number (1-based, matches LaunchDarkly UI)
+            
+        Returns:
+            The variation ID, or None if the number is out of range
+        """
+        variations = flag_config.get('variations', [])
+        # Convert 1-based UI index to 0-based array index
+        variation_index = variation - 1
+        if variation_index < 0 or variation_index >= len(variations):
+            _print(f"❌ Variation {variation} is out of range. Flag has {len(variations)} variations (1-{len(variations)}).")
+            return None
+        return variations[variation_index]['_id']
+    
+    def _build_base_payload(self, segment_keys: List[str], schedule_time_utc: int) -> Dict[str, Any]:
+        """
+        Build the flag-independent part of a scheduled changes payload.
+        
+        Uses LaunchDarkly's semantic patch format. The addRule instruction is
+        missing its variationId, which differs per flag.
+        
+        Args:
+            segment_keys: List of segment keys to target
+            schedule_time_utc: Schedule time in UTC milliseconds
+            
+        Returns:
+            Payload template dict
         """
         return {
-            'clauses': [
+            'executionDate': schedule_time_utc,
+            'instructions': [
                 {
-                    'attribute': 'segmentMatch',
-                    'op': 'segmentMatch', 
-                    'values': [segment_key]
+                    'kind': 'addRule',
+                    'clauses': [
+                        {
+                            'op': 'segmentMatch',
+                            'values': segment_keys,
+                            'contextKind': 'user'
+                        }
+                    ]
                 }
             ],
-            'variation': variation,
-            'rollout': None,
-            'trackEvents': False
+            'comment': f'Scheduled targeting rules for segments: {", ".join(segment_keys)}'
         }
     
     def schedule_targeting_rules(
@@ -171,7 +467,11 @@ class LaunchDarklyScheduler:
         flag_key: str, 
         segment_keys: List[str], 
         schedule_time_est: str,
-        variation: int = 1
+        variation: int = 1,
+        schedule_time_utc: Optional[int] = None,
+        flag_config: Optional[Dict[str, Any]] = None,
+        fallthrough_variation: Optional[int] = None,
+        base_payload: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Schedule targeting rules for a feature flag using LaunchDarkly's Scheduled Changes API.
@@ -181,107 +481,101 @@ class LaunchDarklyScheduler:
             segment_keys: List of segment keys to target
             schedule_time_est: Schedule time in EST format 'YYYY-MM-DD HH:MM:SS'
             variation: The variation number to serve (default: 1, matches LaunchDarkly UI)
+            schedule_time_utc: Pre-validated schedule time in UTC milliseconds;
+                parsed and validated from schedule_time_est when omitted
+            flag_config: Pre-fetched flag configuration; fetched when omitted
+            fallthrough_variation: Optional variation number to also serve as the
+                default rule, applied in the same scheduled change
+            base_payload: Pre-built payload template from _build_base_payload;
+                built when omitted
             
         Returns:
             True if successful, False otherwise
         """
-        print(f"Scheduling targeting rules for flag: {flag_key}")
+        _print(f"Scheduling targeting rules for flag: {flag_key}")
+        
+        # Validate the schedule time before any network I/O
+        if schedule_time_utc is None:
+            schedule_time_utc = self._validate_schedule_time(schedule_time_est)
+            if schedule_time_utc is None:
+                return False
+        schedule_datetime = datetime.fromtimestamp(schedule_time_utc/1000, tz=self._UTC)
         
         # Get current flag configuration
-        flag_config = self.get_flag_config(flag_key)
+        if flag_config is None:
+            flag_config = self.get_flag_config(flag_key)
         if not flag_config:
             return False
         
-        # Convert EST time to UTC timestamp
-        try:
-            schedule_time_utc = self.est_to_utc(schedule_time_est)
-            schedule_datetime = datetime.fromtimestamp(schedule_time_utc/1000, tz=pytz.UTC)
-        except ValueError as e:
-            print(f"Error parsing schedule time: {e}")
-            return False
-        
-        # Check if the schedule time is in the future
-        now_utc = datetime.now(pytz.UTC)
-        if schedule_datetime <= now_utc:
-            print(f"❌ Schedule time must be in the future!")
-            print(f"   Current time (UTC): {now_utc}")
-            print(f"   Schedule time (UTC): {schedule_datetime}")
-            return False
-        
         # Get the actual variation ID from the flag configuration
-        variations = flag_config.get('variations', [])
-        # Convert 1-based UI index to 0-based array index
-        variation_index = variation - 1
-        if variation_index < 0 or variation_index >= len(variations):
-            print(f"❌ Variation {variation} is out of range. Flag has {len(variations)} variations (1-{len(variations)}).")
+        variation_id = self._resolve_variation_id(flag_config, variation)
+        if variation_id is None:
             return False
-        
-        variation_id = variations[variation_index]['_id']
-        print(f"🎯 Using variation ID: {variation_id} (variation {variation})")
+        logger.debug("🎯 Using variation ID: %s (variation %s)", variation_id, variation)
         
         # Use LaunchDarkly's Scheduled Changes API
         url = f'{self.base_url}/projects/{self.project_key}/flags/{flag_key}/environments/{self.environment_key}/scheduled-changes'
         
-        # Prepare the scheduled changes payload using semantic patch operations
-        # Based on LaunchDarkly API docs, we need to use semantic patch format
+        # Fill the flag-specific variation into the shared payload template
+        if base_payload is None:
+            base_payload = self._build_base_payload(segment_keys, schedule_time_utc)
         scheduled_changes_payload = {
-            'executionDate': schedule_time_utc,
-            'instructions': [
-                {
-                    'kind': 'addRule',
-                    'variationId': variation_id,
-                    'clauses': [
-                        {
-                            'op': 'segmentMatch',
-                            'values': segment_keys,
-                            'contextKind': 'user'
-                        }
-                    ]
-                }
-            ],
-            'comment': f'Scheduled targeting rules for segments: {", ".join(segment_keys)}'
+            **base_payload,
+            'instructions': [{**base_payload['instructions'][0], 'variationId': variation_id}]
         }
         
+        # Combine the default-rule change into the same scheduled change so it
+        # costs no extra round-trip
+        if fallthrough_variation is not None:
+            fallthrough_variation_id = self._resolve_variation_id(flag_config, fallthrough_variation)
+            if fallthrough_variation_id is None:
+                return False
+            scheduled_changes_payload['instructions'].append({
+                'kind': 'updateFallthroughVariationOrRollout',
+                'variationId': fallthrough_variation_id
+            })
+        
         try:
-            print(f"🔧 Sending scheduled changes to: {url}")
-            print(f"🔧 Execution date: {schedule_datetime} (UTC)")
-            print(f"🔧 Instructions: {json.dumps(scheduled_changes_payload['instructions'], indent=2)}")
+            logger.debug("🔧 Sending scheduled changes to: %s", url)
+            logger.debug("🔧 Execution date: %s (UTC)", schedule_datetime)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔧 Instructions: %s", json.dumps(scheduled_changes_payload['instructions'], indent=2))
             
-            response = requests.post(url, headers=self.headers, data=json.dumps(scheduled_changes_payload))
+            response = self._request('POST', url, json=scheduled_changes_payload)
             
             if response.status_code == 201:
-                print(f"✅ Successfully scheduled targeting rules for flag: {flag_key}")
-                print(f"   Segments: {', '.join(segment_keys)}")
-                print(f"   Schedule time (EST): {schedule_time_est}")
-                print(f"   Schedule time (UTC): {schedule_datetime}")
-                print(f"   Scheduled change ID: {response.json().get('_id', 'unknown')}")
+                _print(f"✅ Successfully scheduled targeting rules for flag: {flag_key}")
+                _print(f"   Segments: {', '.join(segment_keys)}")
+                _print(f"   Schedule time (EST): {schedule_time_est}")
+                _print(f"   Schedule time (UTC): {schedule_datetime}")
+                _print(f"   Scheduled change ID: {_json(response).get('_id', 'unknown')}")
                 return True
             elif response.status_code == 400:
-                print(f"❌ Bad Request (400) for flag {flag_key}")
-                print(f"   Response: {response.text}")
+                _print(f"❌ Bad Request (400) for flag {flag_key}")
+                _print(f"   Response: {_body_preview(response)}")
                 
                 # Check for specific error messages
                 try:
-                    error_data = response.json()
+                    error_data = _json(response)
                     if "unknown segment" in error_data.get("message", ""):
-                        print(f"   💡 The segment(s) don't exist in your LaunchDarkly project.")
-                        print(f"   💡 Please create the segments first or use existing segment keys.")
+                        _print(f"   💡 The segment(s) don't exist in your LaunchDarkly project.")
+                        _print(f"   💡 Please create the segments first or use existing segment keys.")
                     elif "invalid" in error_data.get("message", ""):
-                        print(f"   💡 Check that the segment keys and flag configuration are valid.")
+                        _print(f"   💡 Check that the segment keys and flag configuration are valid.")
                 except:
                     pass
                 
                 return False
             else:
-                print(f"❌ Error scheduling rules for flag {flag_key}: {response.status_code}")
-                print(f"   Response: {response.text}")
+                _print(f"❌ Error scheduling rules for flag {flag_key}: {response.status_code}")
+                _print(f"   Response: {_body_preview(response)}")
                 return False
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error scheduling rules for flag {flag_key}: {e}")
+            _print(f"❌ Error scheduling rules for flag {flag_key}: {e}")
             if hasattr(e, 'response') and e.response is not None:
-                print(f"   Status Code: {e.response.status_code}")
-                print(f"   Response: {e.response.text}")
+                _print(f"   Status Code: {e.response.status_code}")
+                _print(f"   Response: {_body_preview(e.response)}")
             return False
     
     
@@ -290,7 +584,8 @@ class LaunchDarklyScheduler:
         flag_keys: List[str],
         segment_keys: List[str], 
         schedule_time_est: str,
-        variation: int = 0
+        variation: int = 0,
+        fallthrough_variation: Optional[int] = None
     ) -> Dict[str, bool]:
         """
         Schedule targeting rules for multiple feature flags.
@@ -300,23 +595,60 @@ class LaunchDarklyScheduler:
             segment_keys: List of segment keys to target
             schedule_time_est: Schedule time in EST format 'YYYY-MM-DD HH:MM:SS'
             variation: The variation index to serve (default: 0)
+            fallthrough_variation: Optional variation number to also serve as
+                each flag's default rule
             
         Returns:
             Dict mapping flag keys to success status
         """
         results = {}
         
+        # Schedule each flag once, even if it was passed more than once
+        flag_keys = list(dict.fromkeys(flag_keys))
+        
+        # Drop duplicates and fix the order so identical inputs produce
+        # identical request bodies
+        segment_keys = sorted(set(segment_keys))
+        
         print(f"🚀 Starting to schedule targeting rules for {len(flag_keys)} flags")
         print(f"📅 Schedule time (EST): {schedule_time_est}")
         print(f"🎯 Target segments: {', '.join(segment_keys)}")
         print("-" * 60)
         
-        for flag_key in flag_keys:
-            success = self.schedule_targeting_rules(
-                flag_key, segment_keys, schedule_time_est, variation
-            )
-            results[flag_key] = success
-            print()  # Add spacing between flags
+        # The schedule time is the same for every flag, so validate it once
+        # and fail before issuing any requests
+        schedule_time_utc = self._validate_schedule_time(schedule_time_est)
+        if schedule_time_utc is None:
+            return {flag_key: False for flag_key in flag_keys}
+        
+        # Everything but the variation ID is shared across flags
+        base_payload = self._build_base_payload(segment_keys, schedule_time_utc)
+        
+        # Resolve every flag's variations up front, then overlap the POSTs
+        flag_configs = self._get_flag_configs(flag_keys)
+        for flag_key, flag_config in flag_configs.items():
+            if not flag_config:
+                results[flag_key] = False
+        
+        pending_keys = [flag_key for flag_key in flag_keys if flag_configs[flag_key]]
+        max_workers = max(1, min(MAX_WORKERS, len(pending_keys)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (flag_key, executor.submit(
+                    _buffered, self.schedule_targeting_rules,
+                    flag_key, segment_keys, schedule_time_est, variation,
+                    schedule_time_utc, flag_configs[flag_key], fallthrough_variation,
+                    base_payload
+                ))
+                for flag_key in pending_keys
+            ]
+            # Print each flag's output as one block, in submission order
+            for flag_key, future in futures:
+                success, lines = future.result()
+                for line in lines:
+                    print(line)
+                print()  # Add spacing between flags
+                results[flag_key] = success
         
         # Summary
         successful = sum(1 for success in results.values() if success)
@@ -333,51 +665,81 @@ class LaunchDarklyScheduler:
         
         return results
     
+    def _redacted_api_key(self) -> str:
+        """The API key truncated to its first characters, safe to print."""
+        return f"{self.api_key[:8]}..." if self.api_key else "Not set"
+    
+    def _redacted_headers(self) -> Dict[str, str]:
+        """Request headers with the API key truncated, safe to print."""
+        return {**self.headers, 'Authorization': self._redacted_api_key()}
+    
     def debug_api_info(self):
         """Debug function to print API configuration info."""
         print("🔧 Debug Information:")
-        print(f"   API Key: {self.api_key[:8]}..." if self.api_key else "   API Key: Not set")
+        print(f"   API Key: {self._redacted_api_key()}")
         print(f"   Project Key: {self.project_key}")
         print(f"   Environment Key: {self.environment_key}")
         print(f"   Base URL: {self.base_url}")
-        print(f"   Headers: {self.headers}")
+        print(f"   Headers: {self._redacted_headers()}")
     
     def test_flag_endpoint(self, flag_key: str):
         """Test the specific flag endpoint that's failing."""
         url = f'{self.base_url}/flags/{self.project_key}/{flag_key}'
         print(f"🧪 Testing flag endpoint: {url}")
-        print(f"🧪 Headers: {self.headers}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🧪 Headers: %s", self._redacted_headers())
         
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self._request('GET', url)
             print(f"🧪 Response Status: {response.status_code}")
             print(f"🧪 Response Headers: {dict(response.headers)}")
-            print(f"🧪 Response Text: {response.text[:500]}...")
+            print(f"🧪 Response Text: {_body_preview(response)}")
             return response.status_code == 200
         except Exception as e:
             print(f"🧪 Exception: {e}")
             return False
     
-    def list_segments(self):
-        """List all segments in the project."""
-        url = f'{self.base_url}/segments/{self.project_key}'
-        print(f"🔍 Listing segments from: {url}")
+    def iter_segments(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all segments in the environment, one page at a time.
         
+        Follows LaunchDarkly's _links.next pagination so only one page is held
+        in memory, and callers can stop early without fetching the rest.
+        
+        Yields:
+            Segment dicts as returned by the API
+        
+        Raises:
+            requests.exceptions.HTTPError: If a page cannot be fetched
+        """
+        url = f'{self.base_url}/segments/{self.project_key}/{self.environment_key}?limit=100'
+        
+        while url:
+            logger.debug("🔍 Listing segments from: %s", url)
+            response = self._request('GET', url)
+            response.raise_for_status()
+            page = _json(response)
+            
+            yield from page.get('items', [])
+            
+            next_href = page.get('_links', {}).get('next', {}).get('href')
+            url = urljoin(self.base_url, next_href) if next_href else None
+    
+    def list_segments(self):
+        """List all segments in the environment."""
+        segments = []
         try:
-            response = requests.get(url, headers=self.headers)
-            if response.status_code == 200:
-                segments = response.json()
-                print(f"📋 Found {len(segments.get('items', []))} segments:")
-                for segment in segments.get('items', []):
-                    print(f"   - {segment.get('key', 'unknown')}: {segment.get('name', 'No name')}")
-                return segments.get('items', [])
-            else:
-                print(f"❌ Error listing segments: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return []
+            for segment in self.iter_segments():
+                print(f"   - {segment.get('key', 'unknown')}: {segment.get('name', 'No name')}")
+                segments.append(segment)
+        except requests.exceptions.HTTPError as e:
+            print(f"❌ Error listing segments: {e.response.status_code}")
+            print(f"   Response: {_body_preview(e.response)}")
         except Exception as e:
             print(f"❌ Exception listing segments: {e}")
-            return []
+        
+        print(f"📋 Found {len(segments)} segments")
+        return segments
     
     def create_segment(self, segment_key: str, segment_name: str, description: str = ""):
         """Create a new segment in the project."""
@@ -389,17 +751,17 @@ class LaunchDarklyScheduler:
             'tags': []
         }
         
-        print(f"🔧 Creating segment: {segment_key}")
-        print(f"🔧 Segment data: {json.dumps(segment_data, indent=2)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔧 Segment data: %s", json.dumps(segment_data, indent=2))
         
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(segment_data))
+            response = self._request('POST', url, json=segment_data)
             if response.status_code == 201:
                 print(f"✅ Successfully created segment: {segment_key}")
                 return True
             else:
                 print(f"❌ Error creating segment: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"   Response: {_body_preview(response)}")
                 return False
         except Exception as e:
             print(f"❌ Exception creating segment: {e}")
@@ -431,6 +793,11 @@ def main():
         default=1,
         help='Variation number to serve (default: 1, matches LaunchDarkly UI)'
     )
+    parser.add_argument(
+        '--fallthrough-variation',
+        type=int,
+        help='Also serve this variation number as the default rule in the same scheduled change'
+    )
     parser.add_argument(
         '--debug',
         action='store_true',
@@ -454,6 +821,43 @@ def main():
     
     args = parser.parse_args()
     
+    # Without a terminal, read piped input once and split it into the same
+    # blank-line-separated sections the prompts below would consume. Only do
+    # so when something is missing: a parent may hold stdin open indefinitely.
+    scheduling = not (args.test_flag or args.list_segments or args.create_segment)
+    needs_input = not (args.flags and args.segments and args.schedule_time)
+    if scheduling and needs_input and not sys.stdin.isatty():
+        sections = [[]]
+        for line in sys.stdin.read().splitlines():
+            line = line.strip()
+            if line:
+                sections[-1].append(line)
+            else:
+                sections.append([])
+        sections = iter(sections)
+        if not args.flags:
+            args.flags = next(sections, [])
+        if not args.segments:
+            args.segments = next(sections, [])
+        if not args.schedule_time:
+            time_section = next(sections, [])
+            args.schedule_time = time_section[0] if time_section else None
+        missing = [
+            option for option, value in (
+                ('--flags', args.flags),
+                ('--segments', args.segments),
+                ('--schedule-time', args.schedule_time),
+            ) if not value
+        ]
+        if missing:
+            parser.error(f"{', '.join(missing)} required when stdin is not a terminal")
+    
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.WARNING,
+        format='%(message)s'
+    )
+    
+    scheduler = None
     try:
         # Initialize scheduler
         scheduler = LaunchDarklyScheduler()
@@ -461,6 +865,7 @@ def main():
         # Show debug info if requested
         if args.debug:
             scheduler.debug_api_info()
+            scheduler.verify_connection()
             print()
         
         # Test specific flag if requested
@@ -534,7 +939,8 @@ def main():
         
         # Schedule the rules
         scheduler.schedule_multiple_flags(
-            flag_keys, segment_keys, schedule_time_est, args.variation
+            flag_keys, segment_keys, schedule_time_est, args.variation,
+            args.fallthrough_variation
         )
         
     except KeyboardInterrupt:
@@ -542,6 +948,9 @@ def main():
     except Exception as e:
         print(f"❌ Error: {e}")
         sys.exit(1)
+    finally:
+        if scheduler is not None:
+            scheduler.close()
 
 
 if __name__ == '__main__':
@@ -6,18 +6,73 @@ A lightweight Flask web interface for scheduling feature flag targeting rules.
 
 import os
 import json
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from operator import itemgetter
 import requests
-import pytz
-from datetime import datetime
-from flask import Flask, render_template, request, jsonify, flash, redirect, url_for
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from flask import (
+    Flask, render_template, stream_template, request, jsonify, flash, redirect, url_for, session,
+    get_flashed_messages
+)
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 app.secret_key = os.getenv('FLASK_SECRET_KEY', 'your-secret-key-here')
 
+# (connect, read) timeout in seconds for LaunchDarkly API calls
+REQUEST_TIMEOUT = (3, 10)
+
+# Items requested per page from paginated endpoints (the API maximum)
+PAGE_SIZE = 100
+
+# Accepted schedule times: a calendar date plus a time, with no UTC offset.
+# Covers datetime-local input ("2025-10-16T23:50") and the CLI format
+# ("2025-10-16 23:50:00"); date-only, week and compact ISO forms are rejected.
+SCHEDULE_TIME_RE = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(:\d{2}(\.\d{3}(\d{3})?)?)?')
+
+# Timezones resolved once rather than on every conversion
+EST_TZ = ZoneInfo('America/New_York')
+UTC = timezone.utc
+
+# Seconds a fetched flag configuration is reused before refetching
+FLAG_CONFIG_TTL = 60
+
+# Item fields kept from paginated responses; everything else is discarded
+PAGE_ITEM_FIELDS = ('key', 'name', 'creationDate')
+
+# Seconds project and flag/segment listings are served from cache
+LISTING_CACHE_TTL = 30
+
+# Number of /schedule result sets kept server-side for display
+MAX_STORED_RESULTS = 100
+
+# Worker threads in the shared pool for concurrent API calls, across all requests
+EXECUTOR_WORKERS = 32
+
+# Upper bound on tasks one request may have queued or running in the shared pool
+MAX_WORKERS = 8
+
+# Number of per-project/environment API clients kept alive, least recently used evicted first
+MAX_API_CLIENTS = 8
+
+def _json(response):
+    """Decode a JSON response body straight from bytes, skipping the text decode."""
+    return json.loads(response.content)
+
 class LaunchDarklyAPI:
     def __init__(self, project_key=None, environment_key=None):
         self.api_key = os.getenv('LD_API_KEY')
@@ -30,209 +85,196 @@ class LaunchDarklyAPI:
         
         self.headers = {
             'Authorization': self.api_key,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         }
+        
+        # Pooled keep-alive session; idempotent requests retry transient errors
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        
+        # flag_key -> (fetched_at, config), see get_flag_config
+        self._flag_cache = {}
+        self._flag_cache_lock = threading.Lock()
+        
+        # (path, offset) -> (etag, page), see _fetch_page
+        self._etag_cache = {}
+        self._etag_cache_lock = threading.Lock()
+    
+    def close(self):
+        """Close the pooled session and its keep-alive connections."""
+        self.session.close()
+    
+    def _fetch_page(self, path, offset, label):
+        """
+        Fetch one page of a paginated endpoint, or None on error.
+        
+        Items are trimmed to PAGE_ITEM_FIELDS. Pages are revalidated with their
+        ETag, so an unchanged page comes back as a bodiless 304 and is served
+        from the cache.
+        """
+        url = f'{self.base_url}{path}?limit={PAGE_SIZE}&offset={offset}'
+        cache_key = (path, offset)
+        with self._etag_cache_lock:
+            cached = self._etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        try:
+            response = self.session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached:
+                return cached[1]
+            if response.status_code == 200:
+                data = _json(response)
+                page = {
+                    'items': [
+                        {field: item[field] for field in PAGE_ITEM_FIELDS if field in item}
+                        for item in data.get('items', [])
+                    ],
+                    'totalCount': data.get('totalCount')
+                }
+                etag = response.headers.get('ETag')
+                if etag:
+                    with self._etag_cache_lock:
+                        self._etag_cache[cache_key] = (etag, page)
+                return page
+            logger.warning("Error fetching %s: %s", label, response.status_code)
+        except Exception as e:
+            logger.error("Error fetching %s: %s", label, e)
+        return None
+    
+    def _get_all_items(self, path, label):
+        """
+        Get all items from a paginated endpoint.
+        
+        Pages are fetched sequentially: callers already run on the shared
+        executor, which bounds concurrency. When the first page reports a
+        totalCount, no trailing empty page is requested; otherwise pages are
+        requested until one comes back short. Raises RuntimeError if any page
+        fails, rather than returning a partial list.
+        """
+        items = []
+        offset, total = 0, None
+        while total is None or offset < total:
+            page = self._fetch_page(path, offset, label)
+            if page is None:
+                raise RuntimeError(f"Failed to fetch {label} (offset {offset})")
+            page_items = page.get('items', [])
+            items.extend(page_items)
+            if offset == 0:
+                total = page.get('totalCount')
+            offset += PAGE_SIZE
+            if total is None and len(page_items) < PAGE_SIZE:
+                break
+        return items
     
     def get_projects(self):
         """Get all projects accessible to the API key with pagination."""
-        all_projects = []
-        offset = 0
-        limit = 20
-        
-        while True:
-            url = f'{self.base_url}/projects?limit={limit}&offset={offset}'
-            try:
-                response = requests.get(url, headers=self.headers)
-                if response.status_code == 200:
-                    data = response.json()
-                    projects = data.get('items', [])
-                    
-                    if not projects:  # No more projects
-                        break
-                    
-                    all_projects.extend([{
-                        'key': project['key'], 
-                        'name': project.get('name', project['key'])
-                    } for project in projects])
-                    
-                    # Check if we got fewer than the limit (last page)
-                    if len(projects) < limit:
-                        break
-                    
-                    offset += limit
-                else:
-                    print(f"Error fetching projects: {response.status_code}")
-                    break
-            except Exception as e:
-                print(f"Error fetching projects: {e}")
-                break
-        
-        return all_projects
+        return [{
+            'key': project['key'], 
+            'name': project.get('name', project['key'])
+        } for project in self._get_all_items('/projects', 'projects')]
     
     def get_environments(self, project_key):
         """Get all environments for a specific project."""
         url = f'{self.base_url}/projects/{project_key}/environments'
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                environments = response.json()
+                environments = _json(response)
                 return [{'key': env['key'], 'name': env.get('name', env['key'])} for env in environments.get('items', [])]
             return []
         except Exception as e:
-            print(f"Error fetching environments: {e}")
+            logger.error("Error fetching environments: %s", e)
             return []
     
+    def _newest_first(self, items):
+        """Project items to key/name dicts, sorted by creation date (newest first)."""
+        rows = [
+            (item.get('creationDate', 0), item['key'], item.get('name', item['key']))
+            for item in items
+        ]
+        rows.sort(key=itemgetter(0), reverse=True)
+        return [{'key': key, 'name': name} for _, key, name in rows]
+    
     def get_flags(self):
         """Get all feature flags in the project with pagination."""
-        all_flags = []
-        offset = 0
-        limit = 20
-        
-        while True:
-            url = f'{self.base_url}/flags/{self.project_key}?limit={limit}&offset={offset}'
-            try:
-                response = requests.get(url, headers=self.headers)
-                if response.status_code == 200:
-                    data = response.json()
-                    flags = data.get('items', [])
-                    
-                    if not flags:  # No more flags
-                        break
-                    
-                    all_flags.extend([{
-                        'key': flag['key'], 
-                        'name': flag.get('name', flag['key']),
-                        'creationDate': flag.get('creationDate', 0)
-                    } for flag in flags])
-                    
-                    # Check if we got fewer than the limit (last page)
-                    if len(flags) < limit:
-                        break
-                    
-                    offset += limit
-                else:
-                    print(f"Error fetching flags: {response.status_code}")
-                    break
-            except Exception as e:
-                print(f"Error fetching flags: {e}")
-                break
-        
-        # Sort flags by creation date (newest first)
-        all_flags.sort(key=lambda x: x.get('creationDate', 0), reverse=True)
-        return all_flags
+        return self._newest_first(self._get_all_items(f'/flags/{self.project_key}', 'flags'))
     
     def get_segments(self):
         """Get all segments in the environment with pagination."""
-        all_segments = []
-        offset = 0
-        limit = 20
-        
-        while True:
-            url = f'{self.base_url}/segments/{self.project_key}/{self.environment_key}?limit={limit}&offset={offset}'
-            try:
-                response = requests.get(url, headers=self.headers)
-                if response.status_code == 200:
-                    data = response.json()
-                    segments = data.get('items', [])
-                    
-                    if not segments:  # No more segments
-                        break
-                    
-                    all_segments.extend([{
-                        'key': segment['key'], 
-                        'name': segment.get('name', segment['key']),
-                        'creationDate': segment.get('creationDate', 0)
-                    } for segment in segments])
-                    
-                    # Check if we got fewer than the limit (last page)
-                    if len(segments) < limit:
-                        break
-                    
-                    offset += limit
-                else:
-                    print(f"Error fetching segments: {response.status_code}")
-                    break
-            except Exception as e:
-                print(f"Error fetching segments: {e}")
-                break
-        
-        # Sort segments by creation date (newest first)
-        all_segments.sort(key=lambda x: x.get('creationDate', 0), reverse=True)
-        return all_segments
+        return self._newest_first(
+            self._get_all_items(f'/segments/{self.project_key}/{self.environment_key}', 'segments')
+        )
     
     def get_flag_config(self, flag_key):
-        """Get flag configuration."""
+        """Get flag configuration, reusing a cached copy for FLAG_CONFIG_TTL seconds."""
+        with self._flag_cache_lock:
+            cached = self._flag_cache.get(flag_key)
+        if cached and time.monotonic() - cached[0] < FLAG_CONFIG_TTL:
+            return cached[1]
+        
         url = f'{self.base_url}/flags/{self.project_key}/{flag_key}'
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200:
-                return response.json()
+                config = _json(response)
+                with self._flag_cache_lock:
+                    self._flag_cache[flag_key] = (time.monotonic(), config)
+                return config
             return None
         except Exception as e:
-            print(f"Error fetching flag config: {e}")
+            logger.error("Error fetching flag config: %s", e)
             return None
     
     def est_to_utc(self, est_time_str):
         """Convert EST time string to UTC timestamp."""
         try:
-            # Handle both formats: ISO format from datetime-local input and CLI format
-            if 'T' in est_time_str:
-                # ISO format from datetime-local input (e.g., "2025-10-16T23:50")
-                est_time = datetime.fromisoformat(est_time_str)
-            else:
-                # CLI format (e.g., "2025-10-16 23:50:00")
-                est_time = datetime.strptime(est_time_str, '%Y-%m-%d %H:%M:%S')
+            # Check the shape first, then parse with fromisoformat, which is
+            # much faster than strptime
+            if not SCHEDULE_TIME_RE.fullmatch(est_time_str):
+                raise ValueError(
+                    f"'{est_time_str}' is not YYYY-MM-DD HH:MM[:SS] (Eastern time, no UTC offset)"
+                )
+            est_time = datetime.fromisoformat(est_time_str.replace(' ', 'T', 1))
             
-            # Set timezone to EST
-            est_tz = pytz.timezone('US/Eastern')
-            est_time = est_tz.localize(est_time)
+            # Set timezone to EST. Like pytz's localize(), resolve the repeated
+            # fall-back hour and the skipped spring-forward hour to standard time
+            est_time = est_time.replace(tzinfo=EST_TZ, fold=1)
+            if est_time.dst():
+                est_time = est_time.replace(fold=0)
             
             # Convert to UTC
-            utc_time = est_time.astimezone(pytz.UTC)
+            utc_time = est_time.astimezone(UTC)
             
             # Return timestamp in milliseconds
             return int(utc_time.timestamp() * 1000)
         except ValueError as e:
             raise ValueError(f"Invalid time format: {e}")
     
-    def schedule_targeting_rules(self, flag_key, segment_keys, schedule_time_est, variation=1):
-        """Schedule targeting rules for a feature flag."""
-        # Get current flag configuration
-        flag_config = self.get_flag_config(flag_key)
-        if not flag_config:
-            return False, "Failed to fetch flag configuration"
-        
-        # Convert EST time to UTC timestamp
+    def _validate_schedule_time(self, schedule_time_est):
+        """Convert an EST schedule time to UTC milliseconds, checking it is in the future."""
         try:
             schedule_time_utc = self.est_to_utc(schedule_time_est)
-            schedule_datetime = datetime.fromtimestamp(schedule_time_utc/1000, tz=pytz.UTC)
         except ValueError as e:
-            return False, f"Error parsing schedule time: {e}"
-        
-        # Check if the schedule time is in the future
-        now_utc = datetime.now(pytz.UTC)
-        if schedule_datetime <= now_utc:
-            return False, "Schedule time must be in the future!"
-        
-        # Get the actual variation ID from the flag configuration
-        variations = flag_config.get('variations', [])
-        # Convert 1-based UI index to 0-based array index
-        variation_index = variation - 1
-        if variation_index < 0 or variation_index >= len(variations):
-            return False, f"Variation {variation} is out of range. Flag has {len(variations)} variations (1-{len(variations)})."
-        
-        variation_id = variations[variation_index]['_id']
+            raise ValueError(f"Error parsing schedule time: {e}")
         
-        # Use LaunchDarkly's Scheduled Changes API
-        url = f'{self.base_url}/projects/{self.project_key}/flags/{flag_key}/environments/{self.environment_key}/scheduled-changes'
+        # Check if the schedule time is in the future (both in epoch milliseconds)
+        now_ms = int(time.time() * 1000)
+        if schedule_time_utc <= now_ms:
+            raise ValueError("Schedule time must be in the future!")
         
-        # Prepare the scheduled changes payload
-        scheduled_changes_payload = {
+        return schedule_time_utc
+    
+    def _build_base_payload(self, segment_keys, schedule_time_utc):
+        """Build the flag-independent part of a scheduled changes payload."""
+        return {
             'executionDate': schedule_time_utc,
             'instructions': [
                 {
                     'kind': 'addRule',
-                    'variationId': variation_id,
                     'clauses': [
                         {
                             'op': 'segmentMatch',
@@ -244,15 +286,42 @@ class LaunchDarklyAPI:
             ],
             'comment': f'Scheduled targeting rules for segments: {", ".join(segment_keys)}'
         }
+    
+    def _post_rule(self, flag_key, base_payload, variation=1):
+        """Schedule a pre-built targeting rule payload for a single flag."""
+        # Get current flag configuration
+        flag_config = self.get_flag_config(flag_key)
+        if not flag_config:
+            return False, "Failed to fetch flag configuration"
+        
+        # Get the actual variation ID from the flag configuration
+        variations = flag_config.get('variations', [])
+        # Convert 1-based UI index to 0-based array index
+        variation_index = variation - 1
+        if variation_index < 0 or variation_index >= len(variations):
+            return False, f"Variation {variation} is out of range. Flag has {len(variations)} variations (1-{len(variations)})."
+        
+        variation_id = variations[variation_index]['_id']
+        
+        # Use LaunchDarkly's Scheduled Changes API. Scheduled changes are
+        # addressed per flag, so there is no multi-flag request to batch into;
+        # /schedule overlaps these POSTs on the shared executor instead.
+        url = f'{self.base_url}/projects/{self.project_key}/flags/{flag_key}/environments/{self.environment_key}/scheduled-changes'
+        
+        # Fill the flag-specific variation into the shared payload
+        scheduled_changes_payload = {
+            **base_payload,
+            'instructions': [{**base_payload['instructions'][0], 'variationId': variation_id}]
+        }
         
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(scheduled_changes_payload))
+            response = self.session.post(url, json=scheduled_changes_payload, timeout=REQUEST_TIMEOUT)
             
             if response.status_code == 201:
-                scheduled_change_id = response.json().get('_id', 'unknown')
+                scheduled_change_id = _json(response).get('_id', 'unknown')
                 return True, f"Successfully scheduled targeting rules! Scheduled change ID: {scheduled_change_id}"
             elif response.status_code == 400:
-                error_data = response.json()
+                error_data = _json(response)
                 error_msg = error_data.get("message", "Bad Request")
                 if "unknown segment" in error_msg:
                     return False, "One or more segments don't exist in your LaunchDarkly project."
@@ -263,26 +332,134 @@ class LaunchDarklyAPI:
                 
         except requests.exceptions.RequestException as e:
             return False, f"Error scheduling rules: {e}"
+    
+    def schedule_targeting_rules(self, flag_key, segment_keys, schedule_time_est, variation=1):
+        """Schedule targeting rules for a feature flag."""
+        try:
+            schedule_time_utc = self._validate_schedule_time(schedule_time_est)
+        except ValueError as e:
+            return False, str(e)
+        
+        base_payload = self._build_base_payload(segment_keys, schedule_time_utc)
+        return self._post_rule(flag_key, base_payload, variation)
 
 # Initialize the API client (minimal initialization)
 try:
     ld_api = LaunchDarklyAPI()
 except ValueError as e:
-    print(f"Configuration error: {e}")
+    logger.error("Configuration error: %s", e)
     ld_api = None
 
+# API clients per (project_key, environment_key), kept so their pooled
+# connections survive across requests; capped at MAX_API_CLIENTS, see get_api
+_api_instances = OrderedDict()
+_api_instances_lock = threading.Lock()
+
+# Shared pool for fanning route work out to concurrent API calls. Tasks run
+# here must not wait on other tasks submitted to the same pool.
+executor = ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS)
+
+def bounded_map(func, items):
+    """
+    Like executor.map, but with at most MAX_WORKERS of this call's tasks in the pool.
+    
+    The pool is FIFO, so submitting a large batch at once would queue every
+    other request's work behind it. Items are submitted as earlier ones finish.
+    """
+    slots = threading.BoundedSemaphore(MAX_WORKERS)
+    
+    def run(item):
+        try:
+            return func(item)
+        finally:
+            slots.release()
+    
+    futures = []
+    for item in items:
+        slots.acquire()
+        futures.append(executor.submit(run, item))
+    return [future.result() for future in futures]
+
+# Detailed /schedule results by ID; the session cookie only carries the ID
+_results_store = OrderedDict()
+_results_store_lock = threading.Lock()
+
+def store_results(results):
+    """Keep scheduling results server-side and return their ID."""
+    results_id = uuid.uuid4().hex[:12]
+    with _results_store_lock:
+        _results_store[results_id] = results
+        while len(_results_store) > MAX_STORED_RESULTS:
+            _results_store.popitem(last=False)
+    return results_id
+
+def get_results(results_id):
+    """Return stored scheduling results, or None if unknown or evicted."""
+    with _results_store_lock:
+        return _results_store.get(results_id)
+
+# Listing data by cache key -> (fetched_at, value), see cached_listing
+_listing_cache = {}
+_listing_cache_lock = threading.Lock()
+
+def cached_listing(key, fetch):
+    """
+    Return fetch() for key, reusing the result for LISTING_CACHE_TTL seconds.
+    
+    A failed fetch raises (see _get_all_items), so partial listings are never cached.
+    """
+    with _listing_cache_lock:
+        cached = _listing_cache.get(key)
+    if cached and time.monotonic() - cached[0] < LISTING_CACHE_TTL:
+        return cached[1]
+    
+    value = fetch()
+    with _listing_cache_lock:
+        _listing_cache[key] = (time.monotonic(), value)
+    return value
+
+def get_api(project_key, environment_key):
+    """
+    Return the shared API client for a project/environment pair.
+    
+    Keys come from form input, so only the MAX_API_CLIENTS most recently used
+    clients are kept; older ones are evicted and closed.
+    """
+    key = (project_key, environment_key)
+    evicted = []
+    with _api_instances_lock:
+        api_instance = _api_instances.get(key)
+        if api_instance is None:
+            api_instance = _api_instances[key] = LaunchDarklyAPI(project_key, environment_key)
+        _api_instances.move_to_end(key)
+        while len(_api_instances) > MAX_API_CLIENTS:
+            evicted.append(_api_instances.popitem(last=False)[1])
+    for old_instance in evicted:
+        old_instance.close()
+    return api_instance
+
 @app.route('/')
 def index():
     """Main page with project/environment selection."""
     if ld_api is None:
         return render_template('error.html', error="Configuration error: Missing LD_API_KEY environment variable")
     
-    try:
-        projects = ld_api.get_projects()
-        return render_template('index.html', projects=projects)
-    except Exception as e:
-        print(f"❌ Error loading projects: {e}")
-        return render_template('error.html', error=f"Error loading projects: {e}")
+    def iter_projects():
+        # Runs once the streamed template reaches the project list, after the
+        # page head has already been sent, so errors are rendered into the list
+        try:
+            yield from cached_listing(('projects',), ld_api.get_projects)
+        except Exception as e:
+            logger.error("❌ Error loading projects: %s", e)
+            yield {'error': f"Error loading projects: {e}"}
+    
+    results = get_results(session.get('results_id'))
+    # Pop flashed messages before streaming starts: the session cookie goes
+    # out with the headers, before the template renders them
+    get_flashed_messages()
+    # Stream so the browser gets the head (stylesheets, scripts) while the
+    # projects are still being fetched
+    return stream_template('index.html', projects=iter_projects(), results=results)
 
 @app.route('/select-project', methods=['POST'])
 def select_project():
@@ -313,11 +490,17 @@ def select_environment():
         if not project_key or not environment_key:
             return jsonify({'error': 'Missing project or environment'}), 400
         
-        # Create a new API instance with the selected project/environment
-        api_instance = LaunchDarklyAPI(project_key, environment_key)
+        # Reuse the API instance for the selected project/environment
+        api_instance = get_api(project_key, environment_key)
         
-        flags = api_instance.get_flags()
-        segments = api_instance.get_segments()
+        # Flags and segments are independent, so fetch them concurrently
+        flags_future = executor.submit(
+            cached_listing, ('flags', project_key, environment_key), api_instance.get_flags
+        )
+        segments_future = executor.submit(
+            cached_listing, ('segments', project_key, environment_key), api_instance.get_segments
+        )
+        flags, segments = flags_future.result(), segments_future.result()
         
         return jsonify({
             'flags': flags,
@@ -384,19 +567,26 @@ def schedule():
             flash('Please enter a schedule time', 'error')
             return redirect(url_for('index'))
         
-        # Create API instance with selected project/environment
-        api_instance = LaunchDarklyAPI(project_key, environment_key)
+        # Reuse the API instance for the selected project/environment
+        api_instance = get_api(project_key, environment_key)
+        
+        # The schedule time and payload skeleton are the same for every flag
+        try:
+            schedule_time_utc = api_instance._validate_schedule_time(schedule_time)
+        except ValueError as e:
+            flash(str(e), 'error')
+            return redirect(url_for('index'))
+        base_payload = api_instance._build_base_payload(segment_keys, schedule_time_utc)
+        
+        # Schedule each flag concurrently; every flag is an independent GET + POST
+        def schedule_flag(flag_key):
+            success, message = api_instance._post_rule(flag_key, base_payload, variation)
+            return {'flag': flag_key, 'success': success, 'message': message}
         
-        # Schedule for each flag
-        results = []
-        for flag_key in flag_keys:
-            success, message = api_instance.schedule_targeting_rules(
-                flag_key, segment_keys, schedule_time, variation
-            )
-            results.append({'flag': flag_key, 'success': success, 'message': message})
+        results = bounded_map(schedule_flag, flag_keys)
         
         # Show results
-        success_count = sum(1 for r in results if r['success'])
+        success_count = sum(map(itemgetter('success'), results))
         total_count = len(results)
         
         if success_count == total_count:
@@ -405,8 +595,7 @@ def schedule():
             flash(f'Scheduled {success_count}/{total_count} flags. Check details below.', 'warning')
         
         # Store results for display (using session)
-        from flask import session
-        session['results'] = results
+        session['results_id'] = store_results(results)
         session['project_key'] = project_key
         session['environment_key'] = environment_key
         
@@ -417,4 +606,5 @@ def schedule():
         return redirect(url_for('index'))
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
     app.run(debug=True, host='0.0.0.0', port=3001)